@@ -27,15 +27,17 @@ function Download-File {
     $request.Timeout = 15000
 
     $response = $request.GetResponse()
-    $totalLength = [System.Math]::Floor($response.ContentLength / 1024)
+    $contentLength = $response.ContentLength
+    $totalLength = [System.Math]::Floor($contentLength / 1024)
     $responseStream = $response.GetResponseStream()
 
-    $targetStream = New-Object -TypeName System.IO.FileStream -ArgumentList $FileName, 'Create'
-    $buffer = New-Object byte[] 10KB
+    $bufferSize = 64KB
+    $targetStream = New-Object -TypeName System.IO.FileStream -ArgumentList $FileName, 'Create', 'Write', 'None', $bufferSize
+    $buffer = New-Object byte[] $bufferSize
     $downloadedBytes = 0
 
     while ($true) {
-        $count = $responseStream.Read($buffer, 0, $buffer.Length)
+        $count = $responseStream.Read($buffer, 0, $bufferSize)
 
         if ($count -eq 0) {
             break
@@ -45,7 +47,7 @@ function Download-File {
         $downloadedBytes += $count
 
         [System.Console]::CursorLeft = 0
-        [System.Console]::Write("  >> Downloaded {0}K of {1}K ({2}%) <<   ", [System.Math]::Floor($downloadedBytes / 1024), $totalLength, [System.Math]::Floor(($downloadedBytes / $response.ContentLength) * 100))
+        [System.Console]::Write("  >> Downloaded {0}K of {1}K ({2}%) <<   ", [System.Math]::Floor($downloadedBytes / 1024), $totalLength, [System.Math]::Floor(($downloadedBytes / $contentLength) * 100))
     }
 
     $targetStream.Flush()
@@ -136,6 +138,45 @@ function Build-Installer {
     Remove-Folder -FolderPath $SourcePath
 }
 
+function Get-Releases {
+    param (
+        [Parameter(Mandatory = $true)]
+        [string]$Url
+    )
+
+    # Keep the last response and its ETag so later runs can revalidate with
+    # If-None-Match. A 304 has no body, so the second arch run reuses the
+    # cached list instead of downloading it again.
+    $cacheDirectory = Join-Path -Path ([System.IO.Path]::GetTempPath()) -ChildPath "EasyMinGWInstaller"
+    $bodyCachePath = Join-Path -Path $cacheDirectory -ChildPath "releases.json"
+    $etagCachePath = Join-Path -Path $cacheDirectory -ChildPath "releases.etag"
+
+    $headers = @{}
+    if ((Test-Path $bodyCachePath) -and (Test-Path $etagCachePath)) {
+        $headers["If-None-Match"] = (Get-Content -Path $etagCachePath -Raw -Encoding UTF8).Trim()
+    }
+
+    try {
+        $response = Invoke-WebRequest -Uri $Url -Headers $headers -UseBasicParsing
+    }
+    catch {
+        if ($_.Exception.Response -and [int]$_.Exception.Response.StatusCode -eq 304) {
+            Write-Host " -> Releases not modified since last run, using cached list."
+            return Get-Content -Path $bodyCachePath -Raw -Encoding UTF8 | ConvertFrom-Json
+        }
+        throw
+    }
+
+    $etag = [string]$response.Headers["ETag"]
+    if ($etag) {
+        New-Item -Path $cacheDirectory -ItemType Directory -Force | Out-Null
+        Set-Content -Path $bodyCachePath -Value $response.Content -Encoding UTF8
+        Set-Content -Path $etagCachePath -Value $etag -Encoding UTF8
+    }
+
+    return $response.Content | ConvertFrom-Json
+}
+
 function main {
     # Set the GitHub repository details
     $owner = "brechtsanders"
@@ -146,7 +187,7 @@ function main {
 
     # Get the releases information
     $releasesUrl = "https://api.github.com/repos/$owner/$repo/releases"
-    $releasesInfo = Invoke-RestMethod -Uri $releasesUrl
+    $releasesInfo = Get-Releases -Url $releasesUrl
 
     # Filter releases based on the regular expression pattern in the title
     $selectedRelease = $null
@@ -165,7 +206,7 @@ function main {
     # Check if there are any release available
     $selectedAsset = $null
     if ($selectedRelease) {
-        $selectedAsset = $selectedRelease.assets | Where-Object { $_.name -match $pattern }
+        $selectedAsset = $selectedRelease.assets | Where-Object { $_.name -match $pattern } | Select-Object -First 1
         Write-Host " -> Selected Asset: $($selectedAsset.name)"
     }
     else {
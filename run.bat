@@ -6,8 +6,8 @@ CALL :CleanUp
 
 SET "titlePattern=*CC*POSIX*MinGW*UCRT*"
 
-powershell.exe -ExecutionPolicy Bypass -File "Build.ps1" -arch "64" -titlePattern "%titlePattern%" -namePattern "winlibs-x86_64-posix-seh-gcc-[0-9.]+-mingw-w64ucrt-(.*?).7z$"
-powershell.exe -ExecutionPolicy Bypass -File "Build.ps1" -arch "32" -titlePattern "%titlePattern%" -namePattern "winlibs-i686-posix-dwarf-gcc-[0-9.]+-mingw-w64ucrt-(.*?).7z$"
+powershell.exe -ExecutionPolicy Bypass -File "Build.ps1" -arch "64" -titlePattern "%titlePattern%" -namePattern "^winlibs-x86_64-posix-seh-gcc-[0-9.]+-mingw-w64ucrt-(.+)\.7z$"
+powershell.exe -ExecutionPolicy Bypass -File "Build.ps1" -arch "32" -titlePattern "%titlePattern%" -namePattern "^winlibs-i686-posix-dwarf-gcc-[0-9.]+-mingw-w64ucrt-(.+)\.7z$"
 
 CALL :CleanUp
 CALL :END